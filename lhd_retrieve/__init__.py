@@ -5,7 +5,7 @@ A Python package for retrieving LHD (Large Helical Device) measurement data
 using the Retrieve.exe command-line tool on Windows systems.
 """
 
-from .core import LHDRetriever, LHDData
+from .core import LHDRetriever, LHDData, LHDDataMatrix
 from .utils import (
     setup_retrieve_path, 
     validate_retrieve_exe,
@@ -31,6 +31,7 @@ __author__ = "LHD Data Analysis Team"
 __all__ = [
     "LHDRetriever",
     "LHDData", 
+    "LHDDataMatrix",
     "setup_retrieve_path",
     "validate_retrieve_exe",
     "check_windows_environment",
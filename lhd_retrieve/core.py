@@ -1,8 +1,14 @@
+import asyncio
+import csv
 import os
+import shutil
 import subprocess
 import tempfile
+import threading
 import warnings
-from typing import Dict, List, Optional, Any, Union
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, NamedTuple, Optional, Any, Union
 from dataclasses import dataclass
 
 import numpy as np
@@ -11,6 +17,153 @@ import pandas as pd
 from .utils import validate_retrieve_exe, setup_retrieve_path, get_default_retrieve_paths
 
 
+def _has_file_prefix(name: str, file_prefix: str) -> bool:
+    """Check that a file name belongs to file_prefix (prefix followed by a separator)."""
+    if not name.startswith(file_prefix):
+        return False
+    rest = name[len(file_prefix):]
+    return not rest or not rest[0].isalnum()
+
+
+def _remove_file(path: str) -> None:
+    """Delete a file, ignoring errors (used as a finalizer for memory-mapped data)."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _remove_mmap_files(mmap_files: set) -> None:
+    """
+    Delete memory-mapped data files, keeping in mmap_files only those that could
+    not be deleted yet (on Windows a file cannot be deleted while it is mapped).
+    """
+    for path in list(mmap_files):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            continue
+        mmap_files.discard(path)
+
+
+def _release_working_dir(working_dir: Optional[str], mmap_files: set) -> None:
+    """Finalizer of LHDRetriever: delete leftover mmap files and the private working directory."""
+    _remove_mmap_files(mmap_files)
+    if working_dir is not None:
+        shutil.rmtree(working_dir, ignore_errors=True)
+
+
+def _memmap_data_file(dat_file: str, dtype: Union[str, np.dtype]) -> np.memmap:
+    """
+    Memory-map a .dat file read-only.
+    
+    The file is first renamed out of the Retrieve.exe naming scheme so that
+    temporary-file cleanup and later retrievals of the same channel cannot
+    delete or overwrite it while mapped. The finalizer deletes it once the
+    mapping is garbage collected; on Windows that attempt can fail because the
+    file is still mapped at that point, so LHDRetriever also keeps track of the
+    file and deletes it in its later cleanups.
+    """
+    fd, mmap_file = tempfile.mkstemp(suffix='.mmap', prefix=os.path.basename(dat_file) + '.',
+                                     dir=os.path.dirname(dat_file) or None)
+    os.close(fd)
+    os.replace(dat_file, mmap_file)
+    try:
+        # Map whole items only; trailing bytes are ignored, like np.fromfile does
+        dtype = np.dtype(dtype)
+        n_items = os.path.getsize(mmap_file) // dtype.itemsize
+        data = np.memmap(mmap_file, dtype=dtype, mode='r', shape=(n_items,))
+    except Exception:
+        # Restore the original name so the caller's fallbacks and cleanup still apply
+        os.replace(mmap_file, dat_file)
+        raise
+    weakref.finalize(data, _remove_file, mmap_file)
+    return data
+
+
+class _TimeSpec(NamedTuple):
+    """Evenly sampled time axis t0 + arange(n) / rate, materialized on demand."""
+    t0: float
+    rate: float
+    n: int
+    
+    def materialize(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """Build the time values for samples [start, stop)."""
+        stop = self.n if stop is None else min(stop, self.n)
+        # Same expression as an eagerly built axis (np.arange(n) / rate), so values are identical
+        time = np.arange(start, stop) / self.rate
+        if self.t0:
+            time += self.t0
+        return time
+
+
+# get_val uses a parallel Numba kernel (if numba is installed) from this many samples on
+_NUMBA_MIN_SIZE = 1_000_000
+_numba_convert = None  # compiled on first use; False if numba is not available
+
+
+def _get_numba_convert():
+    """Return the Numba conversion kernel, or False if numba is not installed."""
+    global _numba_convert
+    if _numba_convert is None:
+        try:
+            from numba import njit, prange
+        except ImportError:
+            _numba_convert = False
+        else:
+            @njit(parallel=True, fastmath=True, cache=True)
+            def convert(data, vresolution, voffset, out):
+                for i in prange(data.size):
+                    out[i] = data[i] * vresolution + voffset
+            _numba_convert = convert
+    return _numba_convert
+
+
+def _voltage_coefficients(metadata: Dict[str, Any]) -> tuple:
+    """
+    Get (VResolution, VOffset) from metadata as floats.
+    
+    Raises:
+        ValueError: If VResolution is missing or the values are not numeric
+    """
+    #metadataにVResolutionかVCoefficient1があればその値を使う
+    vresolution = None 
+    if 'VResolution' in metadata:
+        vresolution = metadata['VResolution']
+    elif 'VCoefficient1' in metadata:
+        vresolution = metadata['VCoefficient1']
+    else:
+        raise ValueError("VResolution or VCoefficient1 not found in metadata. Cannot convert to voltage.")
+    #metadataにVOffsetあるいはVCoefficient0があればその値を使う
+    voffset = None
+    if 'VOffset' in metadata:
+        voffset = metadata['VOffset']
+    elif 'VCoefficient0' in metadata:
+        voffset = metadata['VCoefficient0']
+    else:
+        voffset = 0.0   
+    
+    try:
+        vresolution = float(vresolution)
+        voffset = float(voffset)
+    except (ValueError, TypeError):
+        raise ValueError("VResolution or VOffset values are not numeric")
+    
+    return vresolution, voffset
+
+
+# DataType entries of .prm files and the matching binary dtypes of .dat files
+_PRM_DATA_TYPES = {'INT16': np.int16, 'INT8': np.int8, 'FLOAT': np.float32}
+
+# Extensions of temporary files generated by Retrieve.exe
+_TEMP_FILE_EXTENSIONS = ('.dat', '.prm', '.time', '.tprm', '.tmp')
+
+# .prm entries that differ between channels of the same shot
+_PER_CHANNEL_PRM_KEYS = ('VResolution', 'VOffset', 'VCoefficient0', 'VCoefficient1')
+
+
 @dataclass
 class LHDData:
     """
@@ -18,7 +171,8 @@ class LHDData:
     
     Attributes:
         data: The measurement data as numpy array
-        time: Time axis data
+        time: Time axis data. An evenly sampled axis generated from the
+            sampling rate is built on first access.
         metadata: Dictionary containing shot number, channel info, etc.
         units: Data units
         description: Data description
@@ -29,6 +183,50 @@ class LHDData:
     units: str = ""
     description: str = ""
     
+    def __post_init__(self):
+        # 等間隔の時間軸は(t0, rate, n)だけを保持し、最初にアクセスされた時に配列を作る
+        self._time_spec = None
+        if isinstance(self.time, _TimeSpec):
+            self._set_time_spec(self.time)
+    
+    def __getattr__(self, name: str):
+        # Only called when normal lookup fails, i.e. for a time axis that is not built yet
+        spec = self.__dict__.get('_time_spec')
+        if name != 'time' or spec is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        self.time = spec.materialize()
+        self._time_spec = None
+        return self.time
+    
+    def _set_time_spec(self, spec: _TimeSpec) -> None:
+        """Replace the time axis by one that is generated on first access."""
+        self._time_spec = spec
+        self.__dict__.pop('time', None)
+    
+    def _pending_time_spec(self) -> Optional[_TimeSpec]:
+        """The generated time axis, if it has not been built (or replaced) yet."""
+        return None if 'time' in self.__dict__ else self._time_spec
+    
+    @property
+    def time_start(self) -> Optional[float]:
+        """First time value, without materializing a generated time axis."""
+        spec = self._pending_time_spec()
+        if spec is not None:
+            return float(spec.t0) if spec.n else None
+        if self.time is None or len(self.time) == 0:
+            return None
+        return float(self.time[0])
+    
+    @property
+    def time_end(self) -> Optional[float]:
+        """Last time value, without materializing a generated time axis."""
+        spec = self._pending_time_spec()
+        if spec is not None:
+            return float(spec.materialize(spec.n - 1)[0]) if spec.n else None
+        if self.time is None or len(self.time) == 0:
+            return None
+        return float(self.time[-1])
+    
     def to_pandas(self) -> pd.DataFrame:
         """Convert to pandas DataFrame."""
         return pd.DataFrame({
@@ -36,43 +234,69 @@ class LHDData:
             'data': self.data
         })
     
-    def save_csv(self, filename: str) -> None:
-        """Save data to CSV file."""
-        df = self.to_pandas()
-        df.to_csv(filename, index=False)
-    
-    def get_val(self) -> np.ndarray:
-        """Convert raw data to voltage values using VResolution and VOffset from metadata."""
-        #metadataにVResolutionかVCoefficient1があればその値を使う
-        vresolution = None 
-        if 'VResolution' in self.metadata:
-            vresolution = self.metadata['VResolution']
-        elif 'VCoefficient1' in self.metadata:
-            vresolution = self.metadata['VCoefficient1']
-        else:
-            raise ValueError("VResolution or VCoefficient1 not found in metadata. Cannot convert to voltage.")
-        #metadataにVOffsetあるいはVCoefficient0があればその値を使う
-        voffset = None
-        if 'VOffset' in self.metadata:
-            voffset = self.metadata['VOffset']
-        elif 'VCoefficient0' in self.metadata:
-            voffset = self.metadata['VCoefficient0']
-        else:
-            voffset = 0.0   
+    def save_csv(self, filename: str, chunk_size: int = 1_000_000) -> None:
+        """Save data to CSV file (written in chunks to keep memory flat)."""
+        spec = self._pending_time_spec()
+        with open(filename, 'w', newline='') as f:
+            # Each chunk goes through DataFrame.to_csv, so the text is the same as
+            # to_pandas().to_csv() (shortest round-trip float formatting)
+            for start in range(0, max(len(self.data), 1), chunk_size):
+                stop = start + chunk_size
+                if spec is not None:
+                    # Generate only this chunk of the time axis
+                    time = spec.materialize(start, stop)
+                elif self.time is not None:
+                    time = self.time[start:stop]
+                else:
+                    time = None
+                pd.DataFrame({'time': time, 'data': self.data[start:stop]}).to_csv(
+                    f, index=False, header=start == 0)
+    
+    def get_val(self, dtype: Union[str, np.dtype] = np.float32) -> np.ndarray:
+        """
+        Convert raw data to voltage values using VResolution and VOffset from metadata.
         
-        try:
-            vresolution = float(vresolution)
-            voffset = float(voffset)
-        except (ValueError, TypeError):
-            raise ValueError("VResolution or VOffset values are not numeric")
-        
-        if self.data.dtype == np.int8:
-            # int8の場合は、int16に変換してから計算する
-            val = self.data.astype(np.float32) * vresolution + voffset
-        else:
-            # int16やfloat32の場合はそのまま計算する
-            val = self.data * vresolution + voffset
-
+        Args:
+            dtype: Output dtype. float32 is exact enough for int8/int16 raw data;
+                pass np.float64 if double precision is needed.
+        
+        Raises:
+            ValueError: If called after discard_raw() with a dtype wider than the
+                cached voltage values (the extra precision is no longer available)
+        """
+        if getattr(self, '_raw_discarded', False):
+            # discard_raw()の後はdataがすでに電圧値になっている（キャッシュを壊さないようにコピーを返す）
+            out_dtype = np.dtype(dtype)
+            if out_dtype.itemsize > self._val.dtype.itemsize:
+                raise ValueError(
+                    f"Raw data was discarded; voltage values are only available as "
+                    f"{self._val.dtype} (requested {out_dtype})")
+            return self._val.astype(out_dtype, copy=True)
+        
+        vresolution, voffset = _voltage_coefficients(self.metadata)
+        
+        # memmapの場合も通常のndarrayとして計算する
+        data = np.asarray(self.data)
+        out_dtype = np.dtype(dtype).type
+        
+        # 一時配列を作らないように、出力配列に直接掛け算と足し算を行う
+        val = np.empty(data.shape, dtype=out_dtype)
+        
+        # 大きな配列はnumbaで並列計算する（numbaがなければnumpyで計算する）
+        # numbaが扱えるのはネイティブエンディアンの整数・浮動小数点数のみ
+        use_numba = (data.size >= _NUMBA_MIN_SIZE
+                     and data.dtype.isnative and data.dtype.kind in 'iuf')
+        convert = _get_numba_convert() if use_numba else False
+        if convert:
+            try:
+                convert(np.ascontiguousarray(data).reshape(-1), out_dtype(vresolution),
+                        out_dtype(voffset), val.reshape(-1))
+                return val
+            except Exception:
+                # コンパイルできない型（float16など）はnumpyで計算する
+                pass
+        np.multiply(data, out_dtype(vresolution), out=val)
+        val += out_dtype(voffset)
         return val
         
     
@@ -91,6 +315,24 @@ class LHDData:
     def voltage(self) -> np.ndarray:
         """Get voltage values from data using VResolution and VOffset."""
         return self.val
+    
+    def discard_raw(self) -> None:
+        """
+        Replace the raw data with the cached voltage values to free memory.
+        
+        After this call data holds the voltage values (float32 unless val was
+        computed otherwise), and get_val() can no longer return a wider dtype.
+        A memory-mapped data file is unmapped once no other references to it
+        remain. The file itself is deleted then, or (on Windows) by the next
+        retrieval or close() of the retriever that loaded it.
+        """
+        if getattr(self, '_raw_discarded', False):
+            return
+        self.data = self.val
+        self._raw_discarded = True
+        # memmapの参照を外す（他に参照がなければunmapされる）
+        if hasattr(self, '_mmap'):
+            del self._mmap
 
     def plot(self, **kwargs):
         """Plot the data using matplotlib."""
@@ -108,9 +350,91 @@ class LHDData:
         plt.show()
 
 
+@dataclass
+class LHDDataMatrix:
+    """
+    Container for several channels of one shot stored as a single 2D array.
+    
+    Attributes:
+        data: Measurement data, C-contiguous array of shape (n_channels, n_samples)
+        time: Time axis shared by all channels
+        channels: Channel numbers in row order of data
+        metadata: Dictionary mapping channel numbers to their metadata
+        units: Data units
+        description: Data description
+    """
+    data: np.ndarray
+    time: Optional[np.ndarray]
+    channels: List[int]
+    metadata: Dict[int, Dict[str, Any]]
+    units: str = ""
+    description: str = ""
+    
+    def channel_index(self, channel: int) -> int:
+        """Row index of a channel in data."""
+        return self.channels.index(channel)
+    
+    def get_val(self, dtype: Union[str, np.dtype] = np.float32) -> np.ndarray:
+        """Convert raw data to voltage values, row by row with each channel's VResolution and VOffset."""
+        out_dtype = np.dtype(dtype).type
+        val = np.empty(self.data.shape, dtype=out_dtype)
+        for i, channel in enumerate(self.channels):
+            vresolution, voffset = _voltage_coefficients(self.metadata[channel])
+            np.multiply(self.data[i], out_dtype(vresolution), out=val[i])
+            val[i] += out_dtype(voffset)
+        return val
+    
+    @property
+    def val(self) -> np.ndarray:
+        """Get voltage values from data using VResolution and VOffset."""
+        if not hasattr(self, '_val'):
+            self._val = self.get_val()
+        return self._val
+    
+    @property
+    def voltage(self) -> np.ndarray:
+        """Get voltage values from data using VResolution and VOffset."""
+        return self.val
+    
+    def save_csv(self, filename: str, chunk_size: int = 1_000_000) -> None:
+        """Save data to CSV file with one column per channel (written in chunks)."""
+        with open(filename, 'w', newline='') as f:
+            for start in range(0, max(self.data.shape[1], 1), chunk_size):
+                stop = start + chunk_size
+                columns = {'time': self.time[start:stop] if self.time is not None else None}
+                for i, channel in enumerate(self.channels):
+                    columns[f"ch{channel}"] = self.data[i, start:stop]
+                pd.DataFrame(columns).to_csv(f, index=False, header=start == 0)
+    
+    def plot(self, **kwargs):
+        """Plot all channels using matplotlib."""
+        try:
+            import matplotlib.pyplot as plt
+        except ImportError:
+            raise ImportError("matplotlib is required for plotting")
+        
+        plt.figure(figsize=kwargs.pop('figsize', (10, 6)))
+        x = self.time if self.time is not None else np.arange(self.data.shape[1])
+        for i, channel in enumerate(self.channels):
+            plt.plot(x, self.data[i], label=f"Channel {channel}", **kwargs)
+        plt.xlabel('Time')
+        plt.ylabel(f'{self.description} [{self.units}]' if self.units else self.description)
+        shot = self.metadata[self.channels[0]].get('shot', 'Unknown') if self.channels else 'Unknown'
+        plt.title(f"Shot {shot}")
+        plt.legend()
+        plt.grid(True)
+        plt.show()
+
+
 class LHDRetriever:
     """
     Main class for retrieving LHD measurement data using Retrieve.exe.
+    
+    Multiple channels are normally retrieved with one Retrieve.exe run per
+    channel. For diagnostics whose channels form a contiguous range, Retrieve.exe
+    also accepts a ``start-end`` channel argument; use ``retrieve_channel_range``
+    or ``retrieve_multiple_channels(..., batch=True)`` to fetch them in a single
+    run (falls back to per-channel runs if the range call fails).
     """
     
     def __init__(self, retrieve_path: Optional[str] = None, working_dir: Optional[str] = None):
@@ -119,7 +443,8 @@ class LHDRetriever:
         
         Args:
             retrieve_path: Path to Retrieve.exe. If None, searches in PATH.
-            working_dir: Working directory for temporary files.
+            working_dir: Working directory for temporary files. If None, a private
+                temporary directory is created and removed again by close().
         """
         if retrieve_path:
             self.retrieve_path = setup_retrieve_path(retrieve_path)
@@ -136,13 +461,103 @@ class LHDRetriever:
                     "For WSL, it should be accessible at /mnt/c/LABCOM/Retrieve/bin/Retrieve.exe"
                 )
         
-        # Set working directory to Retrieve.exe directory by default
+        self._closed = False
+        
+        # Renamed .dat files backing lazily loaded (memory-mapped) data
+        self._mmap_files: set = set()
+        self._mmap_files_lock = threading.Lock()
+        
+        # Set working directory to a private directory next to Retrieve.exe by default
+        self._owns_working_dir = not working_dir
         if working_dir:
             self.working_dir = working_dir
         else:
-            # Use the parent directory of Retrieve.exe as working directory
-            import os
-            self.working_dir = os.path.dirname(os.path.abspath(self.retrieve_path))
+            # One directory per retriever: no leftover files from other runs to scan,
+            # and several retrievers can work concurrently
+            retrieve_dir = os.path.dirname(os.path.abspath(self.retrieve_path))
+            try:
+                self.working_dir = tempfile.mkdtemp(prefix='lhdret_', dir=retrieve_dir)
+            except OSError:
+                # Retrieve.exe directory not writable: use the system temp directory
+                self.working_dir = tempfile.mkdtemp(prefix='lhdret_')
+        self._finalizer = weakref.finalize(
+            self, _release_working_dir,
+            self.working_dir if self._owns_working_dir else None, self._mmap_files
+        )
+        
+        # Parsed .prm metadata: {(diag_name, shot, subshot): {'global': {...}, 'per_channel': {channel: {...}}}}
+        self._prm_cache: Dict[tuple, Dict[str, Any]] = {}
+        self._prm_cache_lock = threading.Lock()
+    
+    def close(self) -> None:
+        """
+        Delete leftover memory-mapped data files and remove the private working
+        directory (if one was created).
+        
+        Files that are still mapped by live data cannot be deleted on Windows;
+        they are left in place. The retriever cannot be used after close().
+        """
+        self._closed = True
+        with self._mmap_files_lock:
+            self._finalizer()
+    
+    def __enter__(self) -> "LHDRetriever":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def clear_cache(self) -> None:
+        """Clear cached .prm metadata."""
+        with self._prm_cache_lock:
+            self._prm_cache.clear()
+    
+    def _get_cached_prm(self, cache_key: tuple) -> Optional[Dict[str, Any]]:
+        """
+        Look up cached .prm metadata.
+        
+        Args:
+            cache_key: (diag_name, shot, subshot, channel)
+            
+        Returns:
+            Metadata dictionary, or None if not cached
+        """
+        *shot_key, channel = cache_key
+        with self._prm_cache_lock:
+            entry = self._prm_cache.get(tuple(shot_key))
+            if entry is None or channel not in entry['per_channel']:
+                return None
+            return {**entry['global'], **entry['per_channel'][channel]}
+    
+    def _store_cached_prm(self, cache_key: tuple, metadata: Dict[str, Any]) -> None:
+        """
+        Store .prm metadata, keeping shot-global entries once per shot.
+        
+        'global' only holds the entries that every stored channel has with the same
+        value; everything else is kept per channel.
+        
+        Args:
+            cache_key: (diag_name, shot, subshot, channel)
+            metadata: Parsed .prm metadata
+        """
+        *shot_key, channel = cache_key
+        with self._prm_cache_lock:
+            entry = self._prm_cache.setdefault(tuple(shot_key), {
+                'global': {k: v for k, v in metadata.items() if k not in _PER_CHANNEL_PRM_KEYS},
+                'per_channel': {}
+            })
+            shared = entry['global']
+            # このチャンネルにない、または値が異なる共通キーは各チャンネル側へ移す
+            demoted = {k: v for k, v in shared.items() if k not in metadata or metadata[k] != v}
+            if demoted:
+                for k in demoted:
+                    del shared[k]
+                for channel_metadata in entry['per_channel'].values():
+                    for k, v in demoted.items():
+                        channel_metadata.setdefault(k, v)
+            entry['per_channel'][channel] = {
+                k: v for k, v in metadata.items() if k not in shared
+            }
         
     def _run_retrieve(self, diag_name: str, shot_no: int, subshot_no: int, 
                      ch_no_name: int, file_prefix: Optional[str] = None, 
@@ -162,66 +577,130 @@ class LHDRetriever:
         Returns:
             tuple: (dat_file, prm_file, time_file) paths
         """
-        cmd = [self.retrieve_path, diag_name, str(shot_no), str(subshot_no), str(ch_no_name)]
-        
-        if file_prefix:
-            cmd.append(file_prefix)
-        
-        if options:
-            cmd.extend(options)
+        if self._closed:
+            raise RuntimeError("LHDRetriever is closed")
+        cmd = self._build_command(diag_name, shot_no, subshot_no, ch_no_name, file_prefix, options)
         
         try:
+            # stdout is never used; only stderr is needed for error reports
             result = subprocess.run(
                 cmd,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 cwd=self.working_dir,
                 timeout=300  # 5 minute timeout
             )
             
             if result.returncode != 0:
-                raise RuntimeError(f"Retrieve.exe failed: {result.stderr}\n"+
+                stderr = result.stderr.decode('utf-8', errors='replace')
+                raise RuntimeError(f"Retrieve.exe failed: {stderr}\n"+
                                       f"Command: {' '.join(cmd)}\n"+
                                       f"cwd: {self.working_dir}")
-                                   
-            
-            # Determine output files based on actual Retrieve.exe naming convention
-            # Retrieve.exe creates files with pattern: prefix-shot-subshot-channel.ext
-            if file_prefix:
-                # Look for files that start with the prefix
-                from pathlib import Path
-                working_path = Path(self.working_dir)
-                
-                # Find actual generated files
-                dat_files = list(working_path.glob(f"{file_prefix}*.dat"))
-                prm_files = list(working_path.glob(f"{file_prefix}*.prm"))
-                time_files = list(working_path.glob(f"{file_prefix}*.time"))
-                
-                if dat_files:
-                    dat_file = str(dat_files[0])
-                    # Derive other file names from dat file
-                    base_path = dat_file[:-4]  # Remove .dat extension
-                    prm_file = f"{base_path}.prm"
-                    time_file = f"{base_path}.time"
-                else:
-                    # Fallback to expected names
-                    dat_file = os.path.join(self.working_dir, f"{file_prefix}.dat")
-                    prm_file = os.path.join(self.working_dir, f"{file_prefix}.prm")
-                    time_file = os.path.join(self.working_dir, f"{file_prefix}.time")
-            else:
-                # Default naming when no prefix specified
-                base_name = f"{diag_name}_{shot_no}_{subshot_no}_{ch_no_name}"
-                dat_file = os.path.join(self.working_dir, f"{base_name}.dat")
-                prm_file = os.path.join(self.working_dir, f"{base_name}.prm")
-                time_file = os.path.join(self.working_dir, f"{base_name}.time")
             
-            return dat_file, prm_file, time_file
+            return self._locate_output_files(diag_name, shot_no, subshot_no, ch_no_name, file_prefix)
             
         except subprocess.TimeoutExpired:
             raise RuntimeError("Retrieve.exe timeout after 5 minutes")
         except FileNotFoundError:
             raise FileNotFoundError(f"Retrieve.exe not found: {self.retrieve_path}")
     
+    async def _run_retrieve_async(self, diag_name: str, shot_no: int, subshot_no: int,
+                                  ch_no_name: int, file_prefix: Optional[str] = None,
+                                  options: Optional[List[str]] = None) -> tuple:
+        """
+        Asynchronous version of _run_retrieve using asyncio subprocesses.
+        
+        Args:
+            diag_name: Diagnostic name
+            shot_no: Shot number
+            subshot_no: Sub-shot number
+            ch_no_name: Channel number or signal name
+            file_prefix: Optional file name prefix
+            options: Optional list of command options
+            
+        Returns:
+            tuple: (dat_file, prm_file, time_file) paths
+        """
+        if self._closed:
+            raise RuntimeError("LHDRetriever is closed")
+        cmd = self._build_command(diag_name, shot_no, subshot_no, ch_no_name, file_prefix, options)
+        
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=self.working_dir
+            )
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Retrieve.exe not found: {self.retrieve_path}")
+        
+        try:
+            _, stderr = await asyncio.wait_for(proc.communicate(), timeout=300)  # 5 minute timeout
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise RuntimeError("Retrieve.exe timeout after 5 minutes")
+        
+        if proc.returncode != 0:
+            raise RuntimeError(f"Retrieve.exe failed: {stderr.decode('utf-8', errors='replace')}\n"+
+                               f"Command: {' '.join(cmd)}\n"+
+                               f"cwd: {self.working_dir}")
+        
+        return self._locate_output_files(diag_name, shot_no, subshot_no, ch_no_name, file_prefix)
+    
+    def _build_command(self, diag_name: str, shot_no: int, subshot_no: int,
+                       ch_no_name: int, file_prefix: Optional[str] = None,
+                       options: Optional[List[str]] = None) -> List[str]:
+        """Build the Retrieve.exe command line."""
+        cmd = [self.retrieve_path, diag_name, str(shot_no), str(subshot_no), str(ch_no_name)]
+        
+        if file_prefix:
+            cmd.append(file_prefix)
+        
+        if options:
+            cmd.extend(options)
+        
+        return cmd
+    
+    def _locate_output_files(self, diag_name: str, shot_no: int, subshot_no: int,
+                             ch_no_name: int, file_prefix: Optional[str] = None) -> tuple:
+        """
+        Determine the output files written by a finished Retrieve.exe run.
+        
+        Returns:
+            tuple: (dat_file, prm_file, time_file) paths
+        """
+        # Determine output files based on actual Retrieve.exe naming convention
+        # Retrieve.exe creates files with pattern: prefix-shot-subshot-channel.ext
+        if file_prefix:
+            # Usual name first, otherwise find actual generated files that start with the prefix
+            expected = os.path.join(self.working_dir, f"{file_prefix}-{shot_no}-{subshot_no}-{ch_no_name}.dat")
+            if os.path.exists(expected):
+                dat_files = [expected]
+            else:
+                dat_files = self._scan_prefixed_files(file_prefix, ('.dat',))
+            
+            if dat_files:
+                dat_file = dat_files[0]
+                # Derive other file names from dat file
+                base_path = dat_file[:-4]  # Remove .dat extension
+                prm_file = f"{base_path}.prm"
+                time_file = f"{base_path}.time"
+            else:
+                # Fallback to expected names
+                dat_file = os.path.join(self.working_dir, f"{file_prefix}.dat")
+                prm_file = os.path.join(self.working_dir, f"{file_prefix}.prm")
+                time_file = os.path.join(self.working_dir, f"{file_prefix}.time")
+        else:
+            # Default naming when no prefix specified
+            base_name = f"{diag_name}_{shot_no}_{subshot_no}_{ch_no_name}"
+            dat_file = os.path.join(self.working_dir, f"{base_name}.dat")
+            prm_file = os.path.join(self.working_dir, f"{base_name}.prm")
+            time_file = os.path.join(self.working_dir, f"{base_name}.time")
+        
+        return dat_file, prm_file, time_file
+    
     def create_example_retrieval(self, diag_name: str = "Mag", shot: int = 139400, 
                                subshot: int = 1, channel: int = 32) -> str:
         """
@@ -245,7 +724,8 @@ class LHDRetriever:
                      channel: int, 
                      time_axis: bool = False,
                      frame_number: Optional[int] = None,
-                     dtype: Optional[Union[str, np.dtype]] = None) -> LHDData:
+                     dtype: Optional[Union[str, np.dtype]] = None,
+                     lazy: bool = False) -> LHDData:
         """
         Retrieve measurement data using LHD Retrieve.exe format.
         
@@ -257,6 +737,9 @@ class LHDRetriever:
             time_axis: Generate time axis information (-T option)
             frame_number: Specific frame number (-f option)
             dtype: Data type for reading binary data (str like 'float32', 'int8' or numpy dtype like np.float32, np.int8)
+            lazy: Memory-map the data file instead of reading it into RAM. The
+                file is kept (renamed) until the returned data is garbage collected,
+                and is deleted then or by a later retrieval or close() of this retriever.
             
         Returns:
             LHDData object containing the retrieved data
@@ -268,7 +751,35 @@ class LHDRetriever:
         if frame_number is not None:
             options.extend(['-f', str(frame_number)])
         
-        # Generate unique file prefix
+        return self._retrieve_single(
+            diag_name, shot, subshot, channel, options, dtype=dtype,
+            metadata={'time_axis': time_axis, 'frame_number': frame_number, 'dtype': dtype},
+            cache=frame_number is None,  # Frame-specific retrievals are not cached
+            lazy=lazy
+        )
+    
+    def _retrieve_single(self, diag_name: str, shot: int, subshot: int, channel: int,
+                         options: List[str], dtype: Optional[Union[str, np.dtype]] = None,
+                         metadata: Optional[Dict[str, Any]] = None, cache: bool = True,
+                         lazy: bool = False) -> LHDData:
+        """
+        Run Retrieve.exe for a single channel, parse its output files and clean up.
+        
+        Args:
+            diag_name: Diagnostic name
+            shot: Shot number
+            subshot: Sub-shot number
+            channel: Channel number
+            options: List of command options
+            dtype: Data type for reading binary data
+            metadata: Extra metadata entries (placed before the .prm entries)
+            cache: Use the .prm metadata cache
+            lazy: Memory-map the data file instead of reading it into RAM
+            
+        Returns:
+            LHDData object containing the retrieved data
+        """
+        # Generate unique file prefix (embeds the channel, so concurrent runs don't collide)
         file_prefix = f"retrieve_{diag_name}_{shot}_{subshot}_{channel}"
         
         try:
@@ -282,28 +793,49 @@ class LHDRetriever:
             )
             
             # Parse the output files
-            data, time, metadata = self._parse_retrieve_files(dat_file, prm_file, time_file, dtype)
-            
-            return LHDData(
-                data=data,
-                time=time,
-                metadata={
-                    'diag_name': diag_name,
-                    'shot': shot,
-                    'subshot': subshot,
-                    'channel': channel,
-                    'time_axis': time_axis,
-                    'frame_number': frame_number,
-                    'dtype': dtype,
-                    **metadata
-                },
-                description=f"{diag_name} Shot {shot}.{subshot}, Channel {channel}"
-            )
+            cache_key = (diag_name, shot, subshot, channel) if cache else None
+            parsed = self._parse_retrieve_files(dat_file, prm_file, time_file, dtype,
+                                                cache_key, lazy=lazy)
+            return self._to_lhd_data(diag_name, shot, subshot, channel, parsed, metadata)
             
         finally:
             # Clean up ALL temporary files generated by Retrieve.exe
             self._cleanup_temporary_files(file_prefix)
-            pass
+    
+    def _to_lhd_data(self, diag_name: str, shot: int, subshot: int, channel: int,
+                     parsed: tuple, metadata: Optional[Dict[str, Any]] = None) -> LHDData:
+        """
+        Build an LHDData object from parsed (data, time, metadata).
+        
+        Args:
+            diag_name: Diagnostic name
+            shot: Shot number
+            subshot: Sub-shot number
+            channel: Channel number
+            parsed: Result of _parse_retrieve_files
+            metadata: Extra metadata entries (placed before the .prm entries)
+            
+        Returns:
+            LHDData object
+        """
+        data, time, prm_metadata = parsed
+        result = LHDData(
+            data=data,
+            time=time,
+            metadata={
+                'diag_name': diag_name,
+                'shot': shot,
+                'subshot': subshot,
+                'channel': channel,
+                **(metadata or {}),
+                **prm_metadata
+            },
+            description=f"{diag_name} Shot {shot}.{subshot}, Channel {channel}"
+        )
+        if isinstance(data, np.memmap):
+            # Keep a reference to the mapping for the lifetime of the data
+            result._mmap = data
+        return result
     
     def _cleanup_temporary_files(self, file_prefix: str) -> None:
         """
@@ -312,32 +844,23 @@ class LHDRetriever:
         Args:
             file_prefix: Prefix used for temporary files
         """
+        # 前回までに削除できなかった(まだmapされていた)mmapファイルも消す
+        with self._mmap_files_lock:
+            _remove_mmap_files(self._mmap_files)
+        
         if not file_prefix:
             return
             
         try:
-            from pathlib import Path
-            working_path = Path(self.working_dir)
-            
-            # Find all files that start with the prefix
-            # Retrieve.exe can generate various file extensions
-            temp_file_patterns = [
-                f"{file_prefix}*.dat",
-                f"{file_prefix}*.prm", 
-                f"{file_prefix}*.time",
-                f"{file_prefix}*.tprm",
-                f"{file_prefix}*.tmp"
-            ]
-            
+            # Find all files that start with the prefix (one directory scan)
             files_deleted = 0
-            for pattern in temp_file_patterns:
-                for temp_file in working_path.glob(pattern):
-                    try:
-                        temp_file.unlink()  # Delete file
-                        files_deleted += 1
-                    except (OSError, PermissionError):
-                        # Continue even if some files can't be deleted
-                        pass
+            for temp_file in self._scan_prefixed_files(file_prefix, _TEMP_FILE_EXTENSIONS):
+                try:
+                    os.unlink(temp_file)  # Delete file
+                    files_deleted += 1
+                except OSError:
+                    # Continue even if some files can't be deleted
+                    pass
             
             # Optional: log cleanup for debugging
             # print(f"Cleaned up {files_deleted} temporary files with prefix '{file_prefix}'")
@@ -346,7 +869,27 @@ class LHDRetriever:
             # Don't let cleanup failures affect the main operation
             pass
     
-    def _parse_retrieve_files(self, dat_file: str, prm_file: str, time_file: str, dtype: Optional[Union[str, np.dtype]] = None) -> tuple:
+    def _scan_prefixed_files(self, file_prefix: str, extensions: tuple) -> List[str]:
+        """
+        List files in the working directory belonging to file_prefix with one of the
+        given extensions, using a single directory scan.
+        
+        Args:
+            file_prefix: Prefix used for temporary files
+            extensions: Accepted file extensions (e.g. ('.dat', '.prm'))
+            
+        Returns:
+            List of matching file paths
+        """
+        with os.scandir(self.working_dir) as entries:
+            # _has_file_prefix: e.g. channel 3 must not touch files of channel 32
+            return [entry.path for entry in entries
+                    if entry.name.endswith(extensions) and _has_file_prefix(entry.name, file_prefix)]
+    
+    def _parse_retrieve_files(self, dat_file: str, prm_file: str, time_file: str,
+                              dtype: Optional[Union[str, np.dtype]] = None,
+                              cache_key: Optional[tuple] = None,
+                              lazy: bool = False) -> tuple:
         """
         Parse output files from Retrieve.exe (.dat, .prm, .time).
         
@@ -355,39 +898,58 @@ class LHDRetriever:
             prm_file: Path to .prm file (parameters)
             time_file: Path to .time file (time axis data)
             dtype: Data type for reading binary data (str or numpy dtype)
+            cache_key: (diag_name, shot, subshot, channel) used to cache .prm metadata
+            lazy: Memory-map the .dat file instead of reading it into RAM
             
         Returns:
             Tuple of (data, time, metadata)
         """
         metadata = {}
+        cached_metadata = self._get_cached_prm(cache_key) if cache_key else None
         
         # Read parameter file (.prm)
-        if os.path.exists(prm_file):
+        if cached_metadata is not None:
+            metadata = cached_metadata
+        elif os.path.exists(prm_file):
             try:
                 #prm_fileはcsv形式で保存されており，２列目をキー，3列目を値として読み込む
-                prm_data = pd.read_csv(prm_file, header=None, index_col=1)
-                prm_data = prm_data.iloc[:, 1]  # Get second column as values
-                metadata = prm_data.to_dict()  # Convert to dictionary
-            except pd.errors.EmptyDataError:
-                warnings.warn(f"Parameter file {prm_file} is empty or malformed.")
+                with open(prm_file, newline='') as f:
+                    metadata = {row[1]: row[2] for row in csv.reader(f) if len(row) >= 3}
+                if not metadata:
+                    warnings.warn(f"Parameter file {prm_file} is empty or malformed.")
+                elif cache_key:
+                    self._store_cached_prm(cache_key, metadata)
             except FileNotFoundError:
                 warnings.warn(f"Parameter file not found: {prm_file}")
+            except (OSError, csv.Error, UnicodeDecodeError) as e:
+                warnings.warn(f"Failed to read parameter file {prm_file}: {e}")
 
         # Read data file (.dat)
         if not os.path.exists(dat_file):
             raise FileNotFoundError(f"Data file not found: {dat_file}")
         
+        file_size = os.path.getsize(dat_file)
+        if file_size == 0:
+            raise RuntimeError(f"Data file is empty: {dat_file}")
+        
+        # Choose data type based on dtype parameter, then the DataType entry of the .prm file
+        if dtype is not None:
+            # Handle both string and numpy dtype objects
+            read_dtype = np.dtype(dtype)
+        else:
+            # For raw data, use int16
+            read_dtype = np.dtype(_PRM_DATA_TYPES.get(str(metadata.get('DataType', '')).strip().upper(), np.int16))
+        
         try:
-            # Choose data type based on dtype parameter
-            if dtype is not None:
-                # Handle both string and numpy dtype objects
-                data = np.fromfile(dat_file, dtype=dtype)
+            if file_size < read_dtype.itemsize:
+                # Too short for even one sample: read as int8 (file size is known, no re-read)
+                data = np.fromfile(dat_file, dtype=np.int8).astype(np.int16)
+            elif lazy:
+                data = _memmap_data_file(dat_file, read_dtype)
+                with self._mmap_files_lock:
+                    self._mmap_files.add(data.filename)
             else:
-                # For raw data, use int16
-                data = np.fromfile(dat_file, dtype=np.int16)
-                if len(data) == 0:
-                    # Try int16 as fallback
-                    data = np.fromfile(dat_file, dtype=np.int8).astype(np.int16)
+                data = np.fromfile(dat_file, dtype=read_dtype)
                 
         except Exception as e:
             # Fallback: try reading as text
@@ -398,28 +960,31 @@ class LHDRetriever:
         
         # Read time file (.time) if available
         time_data = None
-        if data.size > 10000000:
-            print("Warning: Data size is very large, generating time axis is skipped.")
-        else:
-            if os.path.exists(time_file):
-                try:
-                    time_data = np.fromfile(time_file, dtype=np.float32)
-                    if len(time_data) == 0:
-                        time_data = np.fromfile(time_file, dtype=np.float64)
-                except Exception as e:
-                    warnings.warn(f"Failed to read time file {time_file}: {e}")
-            
-            # Generate time axis if not available
-            if time_data is None or len(time_data) != len(data):
-                # Use sampling rate from metadata if available
-                sampling_rate = metadata.get('SamplingRate', metadata.get('sampling_rate', 1.0))
-                try:
-                    sampling_rate = float(sampling_rate)
-                except (ValueError, TypeError):
-                    sampling_rate = 1.0
-                
-                time_data = np.arange(len(data)) / sampling_rate
+        if os.path.exists(time_file):
+            try:
+                # float32 or float64, decided by the file size (one sample per data point)
+                time_size = os.path.getsize(time_file)
+                time_dtype = np.float64 if time_size == data.size * 8 else np.float32
+                time_data = np.fromfile(time_file, dtype=time_dtype)
+            except Exception as e:
+                warnings.warn(f"Failed to read time file {time_file}: {e}")
+        
+        # Generate time axis if not available
+        if time_data is None or len(time_data) != len(data):
+            # Use sampling rate from metadata if available
+            sampling_rate = metadata.get('SamplingRate', metadata.get('sampling_rate', 1.0))
+            try:
+                sampling_rate = float(sampling_rate)
+            except (ValueError, TypeError):
+                sampling_rate = 1.0
+            if not sampling_rate > 0:
+                # Zero, negative or NaN rates give no usable time axis: fall back to sample index
+                warnings.warn(f"Invalid SamplingRate {sampling_rate}; using sample index as time axis.")
+                sampling_rate = 1.0
             
+            # Store only (t0, rate, n); LHDData builds the array on first access
+            time_data = _TimeSpec(0.0, sampling_rate, len(data))
+        
         return data, time_data, metadata
     
     def retrieve_multiple_channels(self, 
@@ -427,7 +992,8 @@ class LHDRetriever:
                                   shot: int,
                                   subshot: int,
                                   channels: List[int],
-                                  time_axis: bool = True) -> Dict[int, LHDData]:
+                                  time_axis: bool = True,
+                                  batch: bool = False) -> Dict[int, LHDData]:
         """
         Retrieve data for multiple channels from the same shot.
         Time axis is shared across all channels for efficiency.
@@ -438,26 +1004,82 @@ class LHDRetriever:
             subshot: Sub-shot number
             channels: List of channel numbers
             time_axis: Generate time axis information
+            batch: Retrieve contiguous channels with a single Retrieve.exe run
+                (see retrieve_channel_range)
             
         Returns:
             Dictionary mapping channel numbers to LHDData objects
         """
+        if batch and len(channels) > 1 and all(isinstance(ch, int) for ch in channels):
+            ch_start, ch_end = min(channels), max(channels)
+            if sorted(channels) == list(range(ch_start, ch_end + 1)):
+                results = self.retrieve_channel_range(diag_name, shot, subshot,
+                                                      ch_start, ch_end, time_axis)
+                return {ch: results[ch] for ch in channels if ch in results}
+        
+        options = []
+        if time_axis:
+            options.append('-T')
+        
+        # Each channel is an independent Retrieve.exe run, so run them concurrently.
+        # Duplicates are retrieved once: runs of the same channel share a file prefix
+        # and would delete each other's output files
+        unique_channels = list(dict.fromkeys(channels))
         results = {}
-        shared_time = None
-        shared_metadata = {}
+        max_workers = min(len(unique_channels), os.cpu_count() or 1) or 1
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._retrieve_single, diag_name, shot, subshot, channel, options,
+                                metadata={'time_axis': time_axis}): channel
+                for channel in unique_channels
+            }
+            for future in as_completed(futures):
+                channel = futures[future]
+                try:
+                    results[channel] = future.result()
+                except Exception as e:
+                    warnings.warn(f"Failed to retrieve channel {channel}: {e}")
         
-        for i, channel in enumerate(channels):
-            try:
-                # Prepare options
-                options = []
-                if time_axis:
-                    options.append('-T')
-                
-                # Generate unique file prefix
-                file_prefix = f"retrieve_{diag_name}_{shot}_{subshot}_{channel}"
-                
+        return self._share_time_axis(channels, results)
+    
+    async def retrieve_multiple_channels_async(self,
+                                               diag_name: str,
+                                               shot: int,
+                                               subshot: int,
+                                               channels: List[int],
+                                               time_axis: bool = True,
+                                               max_concurrency: Optional[int] = None) -> Dict[int, LHDData]:
+        """
+        Asynchronous version of retrieve_multiple_channels.
+        All Retrieve.exe runs are started up front (limited by max_concurrency) and
+        each channel's files are parsed as soon as its run finishes, so parsing
+        overlaps with the remaining subprocesses.
+        
+        Args:
+            diag_name: Diagnostic name
+            shot: Shot number
+            subshot: Sub-shot number
+            channels: List of channel numbers
+            time_axis: Generate time axis information
+            max_concurrency: Maximum number of concurrent Retrieve.exe runs
+                (default: number of CPUs)
+            
+        Returns:
+            Dictionary mapping channel numbers to LHDData objects
+        """
+        options = []
+        if time_axis:
+            options.append('-T')
+        
+        # Duplicates would share a file prefix and delete each other's output files
+        unique_channels = list(dict.fromkeys(channels))
+        semaphore = asyncio.Semaphore(max_concurrency or min(len(unique_channels), os.cpu_count() or 1) or 1)
+        
+        async def run(channel):
+            file_prefix = f"retrieve_{diag_name}_{shot}_{subshot}_{channel}"
+            async with semaphore:
                 try:
-                    dat_file, prm_file, time_file = self._run_retrieve(
+                    files = await self._run_retrieve_async(
                         diag_name=diag_name,
                         shot_no=shot,
                         subshot_no=subshot,
@@ -465,37 +1087,182 @@ class LHDRetriever:
                         file_prefix=file_prefix,
                         options=options
                     )
-                    
-                    # Parse the output files
-                    data, time_data, metadata = self._parse_retrieve_files(dat_file, prm_file, time_file, None)
-                    
-                    # Use shared time for all channels (time should be identical across channels)
-                    if i == 0:
-                        # First channel: store time and metadata as shared
-                        shared_time = time_data
-                        shared_metadata = {k: v for k, v in metadata.items() if k not in ['channel']}
-                    
-                    results[channel] = LHDData(
-                        data=data,
-                        time=shared_time,  # Use shared time for all channels
-                        metadata={
-                            'diag_name': diag_name,
-                            'shot': shot,
-                            'subshot': subshot,
-                            'channel': channel,
-                            'time_axis': time_axis,
-                            **shared_metadata  # Use shared metadata (excluding channel-specific data)
-                        },
-                        description=f"{diag_name} Shot {shot}.{subshot}, Channel {channel}"
-                    )
-                    
-                finally:
-                    # Clean up temporary files for this channel
-                    self._cleanup_temporary_files(file_prefix)
-                    
+                    return channel, file_prefix, files, None
+                except Exception as e:
+                    return channel, file_prefix, None, e
+        
+        results = {}
+        tasks = [asyncio.ensure_future(run(channel)) for channel in unique_channels]
+        for coro in asyncio.as_completed(tasks):
+            channel, file_prefix, files, error = await coro
+            try:
+                if error is not None:
+                    raise error
+                dat_file, prm_file, time_file = files
+                parsed = self._parse_retrieve_files(
+                    dat_file, prm_file, time_file, None, (diag_name, shot, subshot, channel))
+                results[channel] = self._to_lhd_data(diag_name, shot, subshot, channel, parsed,
+                                                     {'time_axis': time_axis})
             except Exception as e:
                 warnings.warn(f"Failed to retrieve channel {channel}: {e}")
-                continue
+            finally:
+                # Clean up temporary files for this channel
+                self._cleanup_temporary_files(file_prefix)
+        
+        return self._share_time_axis(channels, results)
+    
+    def retrieve_channels_matrix(self,
+                                 diag_name: str,
+                                 shot: int,
+                                 subshot: int,
+                                 channels: List[int],
+                                 time_axis: bool = True,
+                                 batch: bool = False) -> LHDDataMatrix:
+        """
+        Retrieve multiple channels into one (n_channels, n_samples) array.
+        Useful for cross-channel computations such as np.mean(matrix.data, axis=0).
+        Channels are truncated to the shortest channel length.
+        
+        Args:
+            diag_name: Diagnostic name
+            shot: Shot number
+            subshot: Sub-shot number
+            channels: List of channel numbers
+            time_axis: Generate time axis information
+            batch: Retrieve contiguous channels with a single Retrieve.exe run
+            
+        Returns:
+            LHDDataMatrix object; channels that failed are left out
+        """
+        results = self.retrieve_multiple_channels(diag_name, shot, subshot, channels,
+                                                  time_axis=time_axis, batch=batch)
+        retrieved = list(results)
+        if not retrieved:
+            raise RuntimeError(f"No channels could be retrieved for {diag_name} Shot {shot}.{subshot}")
+        
+        n_samples = min(len(results[channel].data) for channel in retrieved)
+        dtype = np.result_type(*(results[channel].data.dtype for channel in retrieved))
+        
+        matrix = np.empty((len(retrieved), n_samples), dtype=dtype)
+        for i, channel in enumerate(retrieved):
+            matrix[i, :] = results[channel].data[:n_samples]
+        
+        first = results[retrieved[0]]
+        spec = first._pending_time_spec()
+        if spec is not None:
+            time = spec.materialize(0, n_samples)
+        elif first.time is not None:
+            time = first.time[:n_samples]
+        else:
+            time = None
+        
+        return LHDDataMatrix(
+            data=matrix,
+            time=time,
+            channels=retrieved,
+            metadata={channel: results[channel].metadata for channel in retrieved},
+            description=f"{diag_name} Shot {shot}.{subshot}"
+        )
+    
+    def retrieve_channel_range(self,
+                               diag_name: str,
+                               shot: int,
+                               subshot: int,
+                               ch_start: int,
+                               ch_end: int,
+                               time_axis: bool = True) -> Dict[int, LHDData]:
+        """
+        Retrieve a contiguous range of channels with a single Retrieve.exe run.
+        Falls back to one run per channel if Retrieve.exe rejects the range.
+        
+        Args:
+            diag_name: Diagnostic name
+            shot: Shot number
+            subshot: Sub-shot number
+            ch_start: First channel number
+            ch_end: Last channel number (inclusive)
+            time_axis: Generate time axis information
+            
+        Returns:
+            Dictionary mapping channel numbers to LHDData objects
+        """
+        channels = list(range(ch_start, ch_end + 1))
+        
+        options = []
+        if time_axis:
+            options.append('-T')
+        
+        file_prefix = f"retrieve_{diag_name}_{shot}_{subshot}_{ch_start}-{ch_end}"
+        
+        try:
+            try:
+                self._run_retrieve(
+                    diag_name=diag_name,
+                    shot_no=shot,
+                    subshot_no=subshot,
+                    ch_no_name=f"{ch_start}-{ch_end}",
+                    file_prefix=file_prefix,
+                    options=options
+                )
+            except RuntimeError as e:
+                warnings.warn(f"Channel range {ch_start}-{ch_end} retrieval failed, "
+                              f"retrieving channels one by one: {e}")
+                return self.retrieve_multiple_channels(diag_name, shot, subshot, channels, time_axis)
+            
+            results = {}
+            for channel in channels:
+                try:
+                    dat_file, prm_file, time_file = self._find_channel_files(file_prefix, channel)
+                    parsed = self._parse_retrieve_files(
+                        dat_file, prm_file, time_file, None, (diag_name, shot, subshot, channel))
+                    results[channel] = self._to_lhd_data(diag_name, shot, subshot, channel, parsed,
+                                                         {'time_axis': time_axis})
+                except Exception as e:
+                    warnings.warn(f"Failed to retrieve channel {channel}: {e}")
+            
+            return self._share_time_axis(channels, results)
+            
+        finally:
+            self._cleanup_temporary_files(file_prefix)
+    
+    def _find_channel_files(self, file_prefix: str, channel: int) -> tuple:
+        """
+        Locate the output files of one channel from a channel-range run.
+        Retrieve.exe names them prefix-shot-subshot-channel.ext.
         
-        return results
-    
\ No newline at end of file
+        Args:
+            file_prefix: Prefix passed to Retrieve.exe
+            channel: Channel number
+            
+        Returns:
+            tuple: (dat_file, prm_file, time_file) paths
+        """
+        dat_files = self._scan_prefixed_files(file_prefix, (f"-{channel}.dat",))
+        if not dat_files:
+            raise FileNotFoundError(f"Data file not found for channel {channel} ({file_prefix})")
+        
+        base_path = dat_files[0][:-4]  # Remove .dat extension
+        return f"{base_path}.dat", f"{base_path}.prm", f"{base_path}.time"
+    
+    def _share_time_axis(self, channels: List[int], results: Dict[int, LHDData]) -> Dict[int, LHDData]:
+        """
+        Share the first channel's time axis across all retrieved channels.
+        
+        Args:
+            channels: Requested channel numbers (defines the output order)
+            results: Mapping of channel to retrieved LHDData
+            
+        Returns:
+            Dictionary mapping channel numbers to LHDData objects, in requested order
+        """
+        ordered = [results[channel] for channel in dict.fromkeys(channels) if channel in results]
+        if ordered:
+            # Time should be identical across channels; sharing it saves one array per channel
+            first = ordered[0]
+            spec = first._pending_time_spec()
+            for result in ordered[1:]:
+                if spec is not None:
+                    result._set_time_spec(spec)
+                else:
+                    result.time = first.time
+        return {channel: results[channel] for channel in channels if channel in results}
@@ -1,18 +1,45 @@
+import copy
+import functools
 import os
 import platform
 import shutil
-from pathlib import Path
-from typing import Optional
+import stat
+import struct
+from typing import Optional, Union
+
+# platform.system() does not change while the process runs
+_SYSTEM = platform.system()
 
 try:
-    from .wsl_utils import is_windows_compatible, find_windows_retrieve_exe
+    from .wsl_utils import (
+        is_windows_compatible,
+        find_windows_retrieve_exe,
+        _existing_paths,
+        _WSL_RETRIEVE_CANDIDATES,
+        _WINDOWS_RETRIEVE_CANDIDATES
+    )
 except ImportError:
     # Fallback if wsl_utils not available
     def is_windows_compatible():
-        return platform.system() == "Windows"
+        return _SYSTEM == "Windows"
     
     def find_windows_retrieve_exe():
         return None
+    
+    def _existing_paths(candidates):
+        return [path for path in candidates if os.path.exists(path)]
+    
+    _WSL_RETRIEVE_CANDIDATES = ()
+    _WINDOWS_RETRIEVE_CANDIDATES = ()
+
+
+def _is_executable_file(path: str) -> bool:
+    """Check with a single stat that path is a regular file with an execute bit set."""
+    try:
+        mode = os.stat(path).st_mode
+    except OSError:
+        return False
+    return stat.S_ISREG(mode) and bool(mode & 0o111)
 
 
 def validate_retrieve_exe(retrieve_path: Optional[str] = None) -> bool:
@@ -29,12 +56,12 @@ def validate_retrieve_exe(retrieve_path: Optional[str] = None) -> bool:
         raise RuntimeError("This package requires Windows or WSL environment")
     
     if retrieve_path:
-        return os.path.isfile(retrieve_path) and os.access(retrieve_path, os.X_OK)
+        return _is_executable_file(retrieve_path)
     
     return shutil.which("Retrieve.exe") is not None
 
 
-def setup_retrieve_path(retrieve_dir: str) -> str:
+def setup_retrieve_path(retrieve_dir: Union[str, os.PathLike]) -> str:
     """
     Setup the path to Retrieve.exe directory.
     
@@ -51,76 +78,112 @@ def setup_retrieve_path(retrieve_dir: str) -> str:
     if not is_windows_compatible():
         raise RuntimeError("This package requires Windows or WSL environment")
     
-    retrieve_path = Path(retrieve_dir) / "Retrieve.exe"
+    retrieve_path = os.path.join(os.fspath(retrieve_dir), "Retrieve.exe")
     
-    if not retrieve_path.exists():
+    # One stat for both checks
+    try:
+        mode = os.stat(retrieve_path).st_mode
+    except OSError:
         raise FileNotFoundError(f"Retrieve.exe not found in {retrieve_dir}")
     
-    if not os.access(retrieve_path, os.X_OK):
+    if not (stat.S_ISREG(mode) and mode & 0o111):
         raise PermissionError(f"Retrieve.exe is not executable: {retrieve_path}")
     
-    return str(retrieve_path)
+    return retrieve_path
 
 
 def get_default_retrieve_paths() -> list:
     """
     Get common default paths where Retrieve.exe might be installed.
     
+    The fixed install locations are searched once per process; call
+    get_default_retrieve_paths.cache_clear() after installing Retrieve.exe to search
+    again. Locations relative to the current directory are checked on every call
+    and returned as absolute paths.
+    
     Returns:
         list: List of potential Retrieve.exe installation paths
     """
-    common_paths = []
-    
-    if platform.system() == "Windows":
+    # cwd-relative candidates depend on os.getcwd(), so they are never cached
+    relative = [path for path in _default_retrieve_candidates() if not os.path.isabs(path)]
+    found_relative = [os.path.abspath(path) for path in _existing_paths(relative)] if relative else []
+    return list(_find_default_retrieve_paths()) + found_relative
+
+
+def _default_retrieve_candidates() -> tuple:
+    if _SYSTEM == "Windows":
         # Native Windows paths
-        common_paths = [
-            r"C:\LABCOM\Retrieve\bin\Retrieve.exe",
-            r"C:\LHD\Retrieve\Retrieve.exe",
-            r"C:\Program Files\LHD\Retrieve\Retrieve.exe",
-            r"C:\Program Files (x86)\LHD\Retrieve\Retrieve.exe",
-            r".\Retrieve.exe",
-            r".\bin\Retrieve.exe"
-        ]
-    else:
-        # Try WSL paths
-        wsl_retrieve = find_windows_retrieve_exe()
-        if wsl_retrieve:
-            common_paths = [wsl_retrieve]
-        
-        # Also check common WSL mount points
-        common_paths.extend([
-            "/mnt/c/LABCOM/Retrieve/bin/Retrieve.exe",
-            "/mnt/c/LHD/Retrieve/Retrieve.exe",
-            "/mnt/c/Program Files/LHD/Retrieve/Retrieve.exe",
-            "/mnt/c/Program Files (x86)/LHD/Retrieve/Retrieve.exe"
-        ])
-    
-    return [path for path in common_paths if os.path.exists(path)]
+        return _WINDOWS_RETRIEVE_CANDIDATES
+    # Common WSL mount points
+    return _WSL_RETRIEVE_CANDIDATES
+
+
+@functools.lru_cache(maxsize=1)
+def _find_default_retrieve_paths() -> tuple:
+    absolute = [path for path in _default_retrieve_candidates() if os.path.isabs(path)]
+    return tuple(_existing_paths(absolute))
+
+
+def _clear_default_retrieve_paths_cache() -> None:
+    _find_default_retrieve_paths.cache_clear()
+    if hasattr(find_windows_retrieve_exe, 'cache_clear'):
+        find_windows_retrieve_exe.cache_clear()
+
+
+get_default_retrieve_paths.cache_clear = _clear_default_retrieve_paths_cache
+
+
+def _refresh_platform() -> None:
+    """Recompute the cached platform information (e.g. after patching platform.system in tests)."""
+    global _SYSTEM
+    _SYSTEM = platform.system()
+    try:
+        from . import wsl_utils
+        wsl_utils._refresh_platform()
+    except ImportError:
+        pass
+    _clear_windows_environment_cache()
 
 
 def check_windows_environment() -> dict:
     """
     Check Windows environment for LHD data retrieval compatibility.
     
+    The environment is probed once per process; call
+    check_windows_environment.cache_clear() to probe again.
+    
     Returns:
         dict: Environment information including OS, architecture, and Retrieve.exe status
     """
+    # Return a copy so callers cannot modify the cached result
+    return copy.deepcopy(_probe_windows_environment())
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_windows_environment() -> dict:
     env_info = {
-        "os": platform.system(),
+        "os": _SYSTEM,
         "os_version": platform.version(),
-        "architecture": platform.architecture()[0],
+        "architecture": f"{struct.calcsize('P') * 8}bit",
         "is_windows_compatible": is_windows_compatible(),
         "retrieve_in_path": shutil.which("Retrieve.exe") is not None,
         "default_paths_available": get_default_retrieve_paths()
     }
     
-    # Add WSL-specific information if available
-    try:
-        from .wsl_utils import get_wsl_environment_info
-        if platform.system() != "Windows":
-            wsl_info = get_wsl_environment_info()
-            env_info.update(wsl_info)
-    except ImportError:
-        pass
+    # Add WSL-specific information if available (never relevant on native Windows)
+    if _SYSTEM != "Windows":
+        try:
+            from .wsl_utils import get_wsl_environment_info
+            env_info.update(get_wsl_environment_info())
+        except ImportError:
+            pass
     
-    return env_info
\ No newline at end of file
+    return env_info
+
+
+def _clear_windows_environment_cache() -> None:
+    _probe_windows_environment.cache_clear()
+    _clear_default_retrieve_paths_cache()
+
+
+check_windows_environment.cache_clear = _clear_windows_environment_cache
@@ -3,19 +3,63 @@ WSL (Windows Subsystem for Linux) utilities for LHD retrieve package.
 This module provides WSL-specific functionality for accessing Windows tools from Linux.
 """
 
+import functools
 import os
 import platform
-import subprocess
-from typing import Optional, List
+from typing import Optional, List, Sequence
 
+# platform.system() does not change while the process runs
+_SYSTEM = platform.system()
 
+# Windows C: drive mounted into WSL; without it no /mnt/c candidate can exist
+_MNT_C_AVAILABLE = os.path.isdir('/mnt/c')
+
+# Common Retrieve.exe install locations, as seen from WSL and from native Windows
+_WSL_RETRIEVE_CANDIDATES = (
+    "/mnt/c/LABCOM/Retrieve/bin/Retrieve.exe",
+    "/mnt/c/LHD/Retrieve/Retrieve.exe",
+    "/mnt/c/Program Files/LHD/Retrieve/Retrieve.exe",
+    "/mnt/c/Program Files (x86)/LHD/Retrieve/Retrieve.exe",
+)
+
+_WINDOWS_RETRIEVE_CANDIDATES = (
+    r"C:\LABCOM\Retrieve\bin\Retrieve.exe",
+    r"C:\LHD\Retrieve\Retrieve.exe",
+    r"C:\Program Files\LHD\Retrieve\Retrieve.exe",
+    r"C:\Program Files (x86)\LHD\Retrieve\Retrieve.exe",
+    r".\Retrieve.exe",
+    r".\bin\Retrieve.exe",
+)
+
+
+def _refresh_platform() -> None:
+    """Recompute the cached platform information (e.g. after patching platform.system in tests)."""
+    global _SYSTEM, _MNT_C_AVAILABLE
+    _SYSTEM = platform.system()
+    _MNT_C_AVAILABLE = os.path.isdir('/mnt/c')
+    is_wsl.cache_clear()
+    is_windows_compatible.cache_clear()
+    find_windows_retrieve_exe.cache_clear()
+
+
+@functools.lru_cache(maxsize=None)
 def is_wsl() -> bool:
     """
     Check if running in WSL (Windows Subsystem for Linux).
     
+    The result is cached for the lifetime of the process (is_wsl.cache_clear()
+    forces a new check). Set LHD_FORCE_WSL=1 or LHD_FORCE_WSL=0 to skip detection.
+    
     Returns:
         bool: True if running in WSL environment
     """
+    forced = os.environ.get('LHD_FORCE_WSL')
+    if forced in ('0', '1'):
+        return forced == '1'
+    
+    if not os.path.exists('/proc/version'):
+        return False
+    
     try:
         # Check for WSL in kernel version
         with open('/proc/version', 'r') as f:
@@ -25,60 +69,94 @@ def is_wsl() -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=None)
 def is_windows_compatible() -> bool:
     """
-    Check if the environment can run Windows executables.
+    Check if the environment can run Windows executables (cached).
     
     Returns:
         bool: True if Windows or WSL environment
     """
-    return platform.system() == "Windows" or is_wsl()
+    return _SYSTEM == "Windows" or is_wsl()
+
 
+def _existing_paths(candidates: Sequence[str]) -> List[str]:
+    """
+    Return the candidate paths that exist, listing each parent directory only once.
+    
+    One os.scandir per directory replaces a stat per candidate, which is much
+    cheaper on /mnt/c where every lookup crosses the WSL file system bridge.
+    Names are matched case-insensitively, like the Windows file system.
+    
+    Args:
+        candidates: Candidate file paths
+        
+    Returns:
+        List of existing paths, in candidate order
+    """
+    listings = {}
+    found = []
+    for path in candidates:
+        parent, name = os.path.split(path)
+        if parent not in listings:
+            try:
+                with os.scandir(parent or '.') as entries:
+                    listings[parent] = {entry.name.casefold(): entry.name for entry in entries}
+            except OSError:
+                listings[parent] = {}
+        actual_name = listings[parent].get(name.casefold())
+        if actual_name is not None:
+            found.append(os.path.join(parent, actual_name))
+    return found
 
+
+@functools.lru_cache(maxsize=1)
 def find_windows_retrieve_exe() -> Optional[str]:
     """
     Find Retrieve.exe in Windows paths accessible from WSL.
     
+    The result is cached; call find_windows_retrieve_exe.cache_clear() after
+    installing Retrieve.exe.
+    
     Returns:
         str: Path to Retrieve.exe if found, None otherwise
     """
-    if not is_wsl():
+    if not _MNT_C_AVAILABLE or not is_wsl():
         return None
     
-    # Common Windows paths accessible from WSL
-    wsl_windows_paths = [
-        "/mnt/c/LABCOM/Retrieve/bin/Retrieve.exe",
-        "/mnt/c/LHD/Retrieve/Retrieve.exe", 
-        "/mnt/c/Program Files/LHD/Retrieve/Retrieve.exe",
-        "/mnt/c/Program Files (x86)/LHD/Retrieve/Retrieve.exe"
-    ]
-    
-    for path in wsl_windows_paths:
-        if os.path.exists(path):
-            return path
-    
-    return None
+    found = _existing_paths(_WSL_RETRIEVE_CANDIDATES)
+    return found[0] if found else None
 
 
-def test_retrieve_exe(retrieve_path: str) -> bool:
+def test_retrieve_exe(retrieve_path: str, deep: bool = False) -> bool:
     """
     Test if Retrieve.exe can be executed from WSL.
     
     Args:
         retrieve_path: Path to Retrieve.exe
+        deep: Actually start Retrieve.exe instead of only checking that the
+            file exists and is executable (starting a Windows process from WSL
+            is slow)
         
     Returns:
         bool: True if executable and can run
     """
+    if not deep:
+        from .utils import _is_executable_file
+        return _is_executable_file(retrieve_path)
+    
     if not os.path.exists(retrieve_path):
         return False
     
+    # Only needed for the deep check, so imported here
+    import subprocess
+    
     try:
         # Try to run with help flag
         subprocess.run(
             [retrieve_path, "-h"],
             capture_output=True,
-            timeout=10
+            timeout=3
         )
         # Return code might be non-zero for help, but should not timeout
         return True
@@ -96,16 +174,11 @@ def get_wsl_windows_paths() -> List[str]:
     if not is_wsl():
         return []
     
-    return [
-        "/mnt/c/LABCOM/Retrieve/bin/Retrieve.exe",
-        "/mnt/c/LHD/Retrieve/Retrieve.exe",
-        "/mnt/c/Program Files/LHD/Retrieve/Retrieve.exe", 
-        "/mnt/c/Program Files (x86)/LHD/Retrieve/Retrieve.exe"
-    ]
+    return list(_WSL_RETRIEVE_CANDIDATES)
 
 
 def convert_wsl_path_to_windows(wsl_path: str) -> str:
-    """
+    r"""
     Convert WSL path to Windows path.
     
     Args:
@@ -114,6 +187,10 @@ def convert_wsl_path_to_windows(wsl_path: str) -> str:
     Returns:
         str: Windows format path (C:\...)
     """
+    # Fast path for the usual single-letter drive: /mnt/c/... -> C:\...
+    if len(wsl_path) >= 7 and wsl_path[6] == '/' and wsl_path.startswith('/mnt/'):
+        return wsl_path[5].upper() + ':\\' + wsl_path[7:].replace('/', '\\')
+    
     if wsl_path.startswith('/mnt/'):
         # Convert /mnt/c/path to C:\path
         parts = wsl_path.split('/')
@@ -125,6 +202,20 @@ def convert_wsl_path_to_windows(wsl_path: str) -> str:
     return wsl_path
 
 
+def convert_many(wsl_paths: List[str]) -> List[str]:
+    """
+    Convert several WSL paths to Windows paths.
+    
+    Args:
+        wsl_paths: Paths in WSL format (/mnt/c/...)
+        
+    Returns:
+        List of Windows format paths
+    """
+    convert = convert_wsl_path_to_windows
+    return [convert(path) for path in wsl_paths]
+
+
 def get_wsl_environment_info() -> dict:
     """
     Get WSL environment information.
@@ -135,17 +226,15 @@ def get_wsl_environment_info() -> dict:
     info = {
         'is_wsl': is_wsl(),
         'is_windows_compatible': is_windows_compatible(),
-        'platform': platform.system(),
+        'platform': _SYSTEM,
         'available_windows_paths': []
     }
     
     if is_wsl():
-        wsl_paths = get_wsl_windows_paths()
-        available_paths = [path for path in wsl_paths if os.path.exists(path)]
-        info['available_windows_paths'] = available_paths
+        info['available_windows_paths'] = _existing_paths(_WSL_RETRIEVE_CANDIDATES) if _MNT_C_AVAILABLE else []
         
         # Check if we can access Windows C: drive
-        info['windows_c_accessible'] = os.path.exists('/mnt/c/')
+        info['windows_c_accessible'] = _MNT_C_AVAILABLE
         
         # Try to find working Retrieve.exe
         retrieve_exe = find_windows_retrieve_exe()